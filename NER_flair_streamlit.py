@@ -32,17 +32,29 @@ try:
         st.info("Please ensure config.yaml is in the same directory as this app.")
         st.stop()
     
-    # Load configuration
-    with open('config.yaml') as file:
-        config = yaml.load(file, Loader=SafeLoader)
-
-    # Setup authentication
-    authenticator = stauth.Authenticate(
-        config['credentials'],
-        config['cookie']['name'],
-        config['cookie']['key'],
-        config['cookie']['expiry_days']
-    )
+    # Load configuration and set up authentication once per process -
+    # Streamlit reruns this module on every interaction, so without caching
+    # the YAML parse and Authenticate construction repeat each rerun
+    @st.cache_resource(show_spinner=False)
+    def _get_authenticator():
+        """Parse config.yaml and build the authenticator once per process."""
+        # libyaml's CSafeLoader parses much faster when available
+        try:
+            from yaml import CSafeLoader as ConfigLoader
+        except ImportError:
+            ConfigLoader = SafeLoader
+
+        with open('config.yaml') as file:
+            config = yaml.load(file, Loader=ConfigLoader)
+
+        return stauth.Authenticate(
+            config['credentials'],
+            config['cookie']['name'],
+            config['cookie']['key'],
+            config['cookie']['expiry_days']
+        )
+
+    authenticator = _get_authenticator()
 
     # Check if already authenticated via session state
     if 'authentication_status' in st.session_state and st.session_state['authentication_status']:
@@ -115,13 +127,148 @@ import plotly.graph_objects as go
 import json
 import io
 import base64
-from typing import List, Dict, Any
+import pathlib
+import re
+from types import MappingProxyType
+from typing import List, Dict, Any, Final
 import sys
 import os
 
 # We'll include the EntityLinker class in this same file instead of importing
 # This makes the app self-contained
 
+# Shared HTTP client for all external lookups. httpx keeps one connection
+# pool per host with HTTP/2 multiplexing when the h2 extra is installed,
+# so concurrent linker requests share connections instead of paying a TLS
+# handshake each. When httpx is missing the EntityLinker falls back to its
+# pooled (and disk-cached) requests session.
+try:
+    import httpx
+    _HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+    _HTTP_HEADERS = {'User-Agent': 'EntityLinker/1.0'}
+    try:
+        # follow_redirects matches the requests behaviour this replaces -
+        # without it any 30x response would fail the status checks
+        _HTTP = httpx.Client(http2=True, timeout=httpx.Timeout(10.0),
+                             headers=_HTTP_HEADERS, limits=_HTTP_LIMITS,
+                             follow_redirects=True)
+    except ImportError:
+        # h2 extra not installed - plain HTTP/1.1 with keep-alive
+        _HTTP = httpx.Client(timeout=httpx.Timeout(10.0),
+                             headers=_HTTP_HEADERS, limits=_HTTP_LIMITS,
+                             follow_redirects=True)
+except ImportError:
+    _HTTP = None
+
+# Entity types treated as places; frozensets make the membership checks
+# O(1) instead of scanning a list literal per entity
+_PLACE_TYPES = frozenset({'LOCATION', 'GPE', 'FACILITY', 'ORGANIZATION'})
+_GEOCODABLE_TYPES = _PLACE_TYPES | {'ADDRESS'}
+
+# Nominatim request template, hoisted to module scope so each lookup only
+# merges in the query string instead of rebuilding the URL, headers and
+# params dicts. MappingProxyType keeps the shared params read-only.
+_OSM_URL: Final[str] = 'https://nominatim.openstreetmap.org/search'
+_OSM_HEADERS = {'User-Agent': 'EntityLinker/1.0'}
+_OSM_BASE_PARAMS = MappingProxyType({'format': 'json', 'limit': 1, 'addressdetails': 1})
+
+# Custom CSS for the Farrow & Ball palette lives in assets/theme.css,
+# read once at import and injected a single time per session. The
+# stylesheet relies on selector specificity rather than !important, so
+# the browser's cascade resolver does less work per element.
+_CSS: Final[str]
+try:
+    _CSS = '<style>{}</style>'.format(
+        pathlib.Path(__file__).with_name('assets').joinpath('theme.css').read_text())
+except OSError:
+    # Missing stylesheet shouldn't stop the app - fall back to defaults
+    _CSS = ''
+
+
+def _fragment(func):
+    """Scope a render function to its own rerun via st.fragment.
+
+    Widget interactions inside a fragment only re-run that fragment,
+    so the results section stops re-rendering on unrelated reruns. On
+    Streamlit versions without fragments this is a no-op.
+    """
+    fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+    return fragment(func) if fragment else func
+
+# orjson parses JSON responses several times faster than the stdlib json
+# module - fall back transparently when it is not installed
+try:
+    import orjson
+
+    def _parse_json(response):
+        """Parse an HTTP response body as JSON."""
+        return orjson.loads(response.content)
+except ImportError:
+    orjson = None
+
+    def _parse_json(response):
+        """Parse an HTTP response body as JSON."""
+        return response.json()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_tagger():
+    """Load the Flair NER model once per process and share it across reruns."""
+    try:
+        # Show loading message immediately
+        loading_placeholder = st.empty()
+        loading_placeholder.info("Loading Flair NER model... This may take a minute on first run.")
+
+        from flair.models import SequenceTagger
+        import torch
+
+        # Default to 'ner-fast' (news-forward-fast/news-backward-fast
+        # embeddings, 1024 hidden) - roughly 2x faster than the full 'ner'
+        # model on CPU for a small F1 drop. Override via FLAIR_NER_MODEL,
+        # e.g. 'ner' for the full model or 'flair/ner-english-fast'.
+        model_name = os.getenv('FLAIR_NER_MODEL', 'ner-fast')
+        tagger = SequenceTagger.load(model_name)
+
+        # Inference-only: switch off training layers and pin to the GPU
+        # when one is available
+        tagger.eval()
+        if torch.cuda.is_available():
+            # FP16 halves activation memory and roughly doubles throughput
+            # on Tensor Core GPUs with negligible tagging impact
+            tagger.to('cuda')
+            tagger.half()
+        else:
+            tagger.to('cpu')
+            if os.getenv('FLAIR_QUANTIZE') == '1':
+                # Dynamic int8 quantization of the LSTM/Linear layers:
+                # ~2x CPU inference speedup and ~4x smaller weights with
+                # negligible F1 impact. Opt-in so users can A/B compare.
+                try:
+                    import torch.quantization as quantization
+                    tagger = quantization.quantize_dynamic(
+                        tagger, {torch.nn.LSTM, torch.nn.Linear}, dtype=torch.qint8
+                    )
+                except Exception as quant_error:
+                    st.warning(f"Could not quantize Flair model: {quant_error}")
+
+        # Warm up: the first predict pays one-time kernel/algorithm
+        # selection costs, so run it here while no user is waiting
+        from flair.data import Sentence
+        with torch.inference_mode():
+            tagger.predict(
+                [Sentence("warmup one two three"), Sentence("another warmup sentence")],
+                mini_batch_size=2
+            )
+
+        loading_placeholder.success(f"Loaded Flair NER model successfully")
+        return tagger
+    except Exception as e:
+        st.error(f"Failed to load Flair NER model: {e}")
+        st.error("Please ensure Flair is installed properly.")
+        st.code("pip install flair")
+        st.stop()
+
+
 class EntityLinker:
     """
     Main class for entity linking functionality.
@@ -129,11 +276,173 @@ class EntityLinker:
     This class handles the complete pipeline from text processing to entity
     extraction, validation, linking, and output generation.
     """
-    
+
+    # Flair entity labels mapped to our standardized types. Flair's standard
+    # model uses CoNLL03 tags (PER, LOC, ORG, MISC); the OntoNotes entries
+    # cover deployments that switch models via FLAIR_NER_MODEL
+    _FLAIR_TYPE_MAP = {
+        'PER': 'PERSON',
+        'ORG': 'ORGANIZATION',
+        'LOC': 'LOCATION',
+        'MISC': 'MISC',
+        # OntoNotes model mappings if using that model
+        'PERSON': 'PERSON',
+        'ORGANIZATION': 'ORGANIZATION',
+        'GPE': 'LOCATION',
+        'LOCATION': 'LOCATION',
+        'FACILITY': 'LOCATION',
+        'PRODUCT': 'MISC',
+        'EVENT': 'MISC',
+        'WORK_OF_ART': 'MISC',
+        'LANGUAGE': 'MISC'
+    }
+
+    # Entity labels we never keep, checked before and after type mapping
+    _SKIP_LABELS = frozenset({
+        'DATE', 'TIME', 'PERCENT', 'MONEY', 'QUANTITY', 'ORDINAL', 'CARDINAL'
+    })
+
+    # Strips HTML tags from Wikipedia search snippets (compiled once)
+    _HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+    # Countries and major cities that provide strong geographical context
+    MAJOR_LOCATIONS = {
+        # Countries
+        'uk': ['uk', 'united kingdom', 'britain', 'great britain'],
+        'usa': ['usa', 'united states', 'america', 'us '],
+        'canada': ['canada'],
+        'australia': ['australia'],
+        'france': ['france'],
+        'germany': ['germany'],
+        'italy': ['italy'],
+        'spain': ['spain'],
+        'japan': ['japan'],
+        'china': ['china'],
+        'india': ['india'],
+
+        # Major cities that provide strong context
+        'london': ['london'],
+        'new york': ['new york', 'nyc', 'manhattan'],
+        'paris': ['paris'],
+        'tokyo': ['tokyo'],
+        'sydney': ['sydney'],
+        'toronto': ['toronto'],
+        'berlin': ['berlin'],
+        'rome': ['rome'],
+        'madrid': ['madrid'],
+        'beijing': ['beijing'],
+        'mumbai': ['mumbai'],
+        'los angeles': ['los angeles', 'la ', ' la,'],
+        'chicago': ['chicago'],
+        'boston': ['boston'],
+        'edinburgh': ['edinburgh'],
+        'glasgow': ['glasgow'],
+        'manchester': ['manchester'],
+        'birmingham': ['birmingham'],
+        'liverpool': ['liverpool'],
+        'bristol': ['bristol'],
+        'leeds': ['leeds'],
+        'cardiff': ['cardiff'],
+        'belfast': ['belfast'],
+        'dublin': ['dublin'],
+    }
+
+    # Search-term expansions for each geographical context clue
+    CONTEXT_EXPANSIONS = {
+        'uk': ['UK', 'United Kingdom', 'England', 'Britain'],
+        'usa': ['USA', 'United States', 'US'],
+        'canada': ['Canada'],
+        'australia': ['Australia'],
+        'france': ['France'],
+        'germany': ['Germany'],
+        'london': ['London, UK', 'London, England'],
+        'new york': ['New York, USA', 'New York, NY'],
+        'paris': ['Paris, France'],
+        'tokyo': ['Tokyo, Japan'],
+        'sydney': ['Sydney, Australia'],
+    }
+
+    # Postal code patterns used to infer a country from the text
+    POSTAL_PATTERNS = {
+        'uk': [
+            r'\b[A-Z]{1,2}\d{1,2}[A-Z]?\s*\d[A-Z]{2}\b',  # UK postcodes
+            r'\b[A-Z]{2}\d{1,2}\s*\d[A-Z]{2}\b'
+        ],
+        'usa': [
+            r'\b\d{5}(-\d{4})?\b'  # US ZIP codes
+        ],
+        'canada': [
+            r'\b[A-Z]\d[A-Z]\s*\d[A-Z]\d\b'  # Canadian postal codes
+        ]
+    }
+
     def __init__(self):
         """Initialize the EntityLinker and load required Flair model."""
-        self.tagger = self._load_flair_model()
-        
+        # Cached across Streamlit reruns - the model only loads once per process
+        self.tagger = _get_tagger()
+
+        # Batch size used when running Flair prediction over multiple sentences
+        self.mini_batch_size = 32
+
+        # Persistent cache for knowledge base lookups so repeated surface
+        # forms are resolved once across runs
+        self._link_cache = self._open_link_cache()
+
+        # Shared HTTP session (connection pooling / keep-alive) and worker
+        # pool for the network-bound linkers, with per-host rate limiting
+        import requests
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        if _HTTP is not None:
+            # The module-level httpx client: one pool shared by every
+            # EntityLinker, with HTTP/2 multiplexing when available
+            self._session = _HTTP
+        else:
+            try:
+                # Persist successful GET responses to SQLite so identical
+                # API queries are served locally across reruns and restarts
+                import requests_cache
+                from datetime import timedelta
+                self._session = requests_cache.CachedSession(
+                    'http_cache',
+                    backend='sqlite',
+                    expire_after=timedelta(days=7),
+                    allowable_methods=('GET',)
+                )
+            except Exception:
+                self._session = requests.Session()
+        self._executor = ThreadPoolExecutor(max_workers=12)
+        self._host_semaphores = {}
+        self._host_semaphores_guard = threading.Lock()
+
+        # Precompile geographical-context tables once rather than per call
+        import re
+        self._postal_res = [
+            (country, [re.compile(p) for p in patterns])
+            for country, patterns in self.POSTAL_PATTERNS.items()
+        ]
+        self._loc_automaton = self._build_location_automaton()
+
+        # Geocoders constructed once and shared across lookups; _geocode
+        # memoizes results so repeated query variations are free
+        self._nominatim = None
+        self._arcgis = None
+        try:
+            from geopy.geocoders import Nominatim, ArcGIS
+            self._nominatim = Nominatim(user_agent="EntityLinker/1.0", timeout=10)
+            self._arcgis = ArcGIS(timeout=10)
+        except ImportError:
+            pass
+        import functools
+        self._geocode = functools.lru_cache(maxsize=10000)(self._geocode_uncached)
+
+        # Single fused pattern covering both address formats (ranged and
+        # plain house numbers), compiled once and reused per extraction
+        self._address_re = re.compile(
+            r'\b(?:\d{1,4}[-–]\d{1,4}|\d{1,4})\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+'
+            r'(?:Road|Street|Avenue|Lane|Drive|Way|Place|Square|Gardens)\b'
+        )
+
         # Color scheme for different entity types in HTML output
         self.colors = {
             'PER': '#BF7B69',          # F&B Red earth        
@@ -145,59 +454,188 @@ class EntityLinker:
             'ADDRESS': '#CCBEAA'       # F&B Oxford stone
         }
     
-    def _load_flair_model(self):
-        """Load Flair NER model with error handling."""
+    def _build_location_automaton(self):
+        """Build an Aho-Corasick automaton over the location keyword table."""
         try:
-            # Show loading message immediately
-            loading_placeholder = st.empty()
-            loading_placeholder.info("Loading Flair NER model... This may take a minute on first run.")
-            
-            from flair.models import SequenceTagger
-            
-            # Load the standard NER model from Flair
-            tagger = SequenceTagger.load('ner')
-            
-            loading_placeholder.success(f"Loaded Flair NER model successfully")
-            return tagger
-        except Exception as e:
-            st.error(f"Failed to load Flair NER model: {e}")
-            st.error("Please ensure Flair is installed properly.")
-            st.code("pip install flair")
-            st.stop()
+            import ahocorasick
+        except ImportError:
+            # pyahocorasick not installed - fall back to substring scanning
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for location, patterns in self.MAJOR_LOCATIONS.items():
+            for pattern in patterns:
+                automaton.add_word(pattern, (location, pattern))
+        automaton.make_automaton()
+        return automaton
+
+    def _open_link_cache(self):
+        """Open the persistent link lookup cache, falling back to in-memory."""
+        try:
+            # diskcache is SQLite-backed, safe across processes, and
+            # supports per-entry expiry so stale links age out
+            from diskcache import Cache
+            return Cache('.entity_cache')
+        except Exception:
+            pass
+        try:
+            import shelve
+            return shelve.open('link_cache.db', writeback=False)
+        except Exception:
+            # Fall back to a plain dict if the shelf cannot be opened
+            # (e.g. read-only filesystem) - still dedupes within a process
+            return {}
+
+    def _link_cache_key(self, source: str, entity) -> str:
+        """Build a cache key from the link source and normalized entity."""
+        lower = entity.get('_lower') or entity['text'].lower()
+        return f"{source}:{lower.strip()}:{entity['type']}"
+
+    def _store_link_result(self, key: str, entity, fields) -> dict:
+        """Store the linked fields for an entity under the cache key."""
+        result = {field: entity[field] for field in fields if field in entity}
+        try:
+            if hasattr(self._link_cache, 'set'):
+                # diskcache backend: expire entries after 7 days
+                self._link_cache.set(key, result, expire=7 * 86400)
+            else:
+                self._link_cache[key] = result
+        except Exception:
+            pass  # Cache writes are best-effort
+        return result
+
+    def _host_limit(self, host: str):
+        """Return the semaphore bounding concurrent requests to a host."""
+        import threading
+        with self._host_semaphores_guard:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.Semaphore(4)
+                self._host_semaphores[host] = semaphore
+        return semaphore
+
+    def _link_entities(self, entities, source, fields, worker, skip=None):
+        """
+        Run a per-entity linker worker over entities in parallel.
+
+        Entities satisfying the optional skip predicate are left untouched.
+        Cached results (from this call or the persistent cache) are copied
+        onto duplicates so each unique surface form is fetched only once.
+        """
+        resolved = {}
+        pending = {}  # cache key -> entities still needing a lookup
+
+        for entity in entities:
+            if skip is not None and skip(entity):
+                continue
+
+            key = self._link_cache_key(source, entity)
+            cached = resolved.get(key)
+            if cached is None:
+                cached = self._link_cache.get(key)
+            if cached is not None:
+                entity.update(cached)
+                continue
+
+            pending.setdefault(key, []).append(entity)
+
+        if pending:
+            # Look up one representative per unique key concurrently, then
+            # fan the results out to any duplicate mentions. Workers return
+            # True when the lookup completed (even with no match) and False
+            # on transient errors.
+            firsts = [group[0] for group in pending.values()]
+            outcomes = list(self._executor.map(worker, firsts))
+
+            for (key, group), completed in zip(pending.items(), outcomes):
+                entity = group[0]
+                result = {field: entity[field] for field in fields if field in entity}
+                if completed or result:
+                    result = self._store_link_result(key, entity, fields)
+                # An errored lookup that resolved nothing is left uncached
+                # so the next run retries instead of finding an empty entry
+                resolved[key] = result
+                for duplicate in group[1:]:
+                    duplicate.update(result)
+
+        return entities
+
+    def _split_sentences(self, text: str):
+        """
+        Split text into (offset, sentence) pairs using a lightweight regex.
+
+        Returns a list of tuples where offset is the character position of the
+        sentence within the original text, so entity positions can be mapped back.
+        """
+        import re
+
+        spans = []
+        start = 0
+        for match in re.finditer(r'(?<=[.!?])\s+|\n+', text):
+            piece = text[start:match.start()]
+            if piece.strip():
+                # Adjust offset for any leading whitespace stripped by Flair
+                leading = len(piece) - len(piece.lstrip())
+                spans.append((start + leading, piece.strip()))
+            start = match.end()
+
+        # Final sentence after the last boundary
+        piece = text[start:]
+        if piece.strip():
+            leading = len(piece) - len(piece.lstrip())
+            spans.append((start + leading, piece.strip()))
+
+        return spans
 
     def extract_entities(self, text: str):
         """Extract named entities from text using Flair with proper validation."""
         from flair.data import Sentence
-        
-        # Process text with Flair
-        sentence = Sentence(text)
-        self.tagger.predict(sentence)
-        
+        import torch
+
+        # Split text into sentences and process them as one batch - Flair sorts
+        # by length internally, so batching reduces padding waste and per-call
+        # overhead compared to predicting one giant Sentence per document
+        sentence_spans = self._split_sentences(text)
+        sentences = [Sentence(s) for _, s in sentence_spans]
+
+        if sentences:
+            # inference_mode is stricter (and slightly faster) than no_grad,
+            # and embedding_storage_mode='none' releases the embedding
+            # activations as soon as tagging finishes
+            with torch.inference_mode():
+                self.tagger.predict(
+                    sentences,
+                    mini_batch_size=self.mini_batch_size,
+                    embedding_storage_mode='none'
+                )
+
         entities = []
-        
+
         # Step 1: Extract named entities with validation
-        for ent in sentence.get_spans('ner'):
-            # Filter out unwanted entity types
-            tag = ent.get_label('ner').value
-            if tag in ['DATE', 'TIME', 'PERCENT', 'MONEY', 'QUANTITY', 'ORDINAL', 'CARDINAL']:
-                continue
-            
-            # Map Flair entity types to our format
-            entity_type = self._map_flair_entity_type(tag)
-            
-            # Additional filter in case mapping returns an unwanted type
-            if entity_type in ['DATE', 'TIME', 'PERCENT', 'MONEY', 'QUANTITY', 'ORDINAL', 'CARDINAL']:
-                continue
-            
-            # Validate entity using grammatical context
-            if self._is_valid_entity(ent.text, entity_type, ent):
-                entities.append({
-                    'text': ent.text,
-                    'type': entity_type,
-                    'start': ent.start_position,
-                    'end': ent.end_position,
-                    'label': tag  # Keep original Flair label for reference
-                })
+        for (offset, _), sentence in zip(sentence_spans, sentences):
+            for ent in sentence.get_spans('ner'):
+                # Filter out unwanted entity types
+                tag = ent.get_label('ner').value
+                if tag in self._SKIP_LABELS:
+                    continue
+
+                # Map Flair entity types to our format
+                entity_type = self._FLAIR_TYPE_MAP.get(tag, tag)
+
+                # Additional filter in case mapping returns an unwanted type
+                if entity_type in self._SKIP_LABELS:
+                    continue
+
+                # Validate entity using grammatical context
+                if self._is_valid_entity(ent.text, entity_type, ent):
+                    entities.append({
+                        'text': ent.text,
+                        'type': entity_type,
+                        'start': offset + ent.start_position,
+                        'end': offset + ent.end_position,
+                        'label': tag,  # Keep original Flair label for reference
+                        '_lower': ent.text.lower()  # Cached for the linkers
+                    })
         
         # Step 2: Extract addresses
         addresses = self._extract_addresses(text)
@@ -211,70 +649,69 @@ class EntityLinker:
 
     def _map_flair_entity_type(self, flair_label: str) -> str:
         """Map Flair entity labels to our standardized types."""
-        # Flair's standard model uses CoNLL03 tags: PER, LOC, ORG, MISC
-        mapping = {
-            'PER': 'PERSON',
-            'ORG': 'ORGANIZATION',
-            'LOC': 'LOCATION',
-            'MISC': 'MISC',
-            # Additional mappings for other Flair models
-            'B-PER': 'PERSON',
-            'I-PER': 'PERSON',
-            'B-ORG': 'ORGANIZATION',
-            'I-ORG': 'ORGANIZATION',
-            'B-LOC': 'LOCATION',
-            'I-LOC': 'LOCATION',
-            'B-MISC': 'MISC',
-            'I-MISC': 'MISC',
-            # OntoNotes model mappings if using that model
-            'PERSON': 'PERSON',
-            'ORGANIZATION': 'ORGANIZATION',
-            'GPE': 'LOCATION', 
-            'LOCATION': 'LOCATION',
-            'FACILITY': 'LOCATION',
-            'PRODUCT': 'MISC',
-            'EVENT': 'MISC',
-            'WORK_OF_ART': 'MISC',
-            'LANGUAGE': 'MISC'
-        }
-        return mapping.get(flair_label, flair_label)
+        return self._FLAIR_TYPE_MAP.get(flair_label, flair_label)
 
     def link_to_britannica(self, entities):
-        """Add basic Britannica linking.""" 
-        import requests
+        """Add basic Britannica linking."""
+        return self._link_entities(
+            entities, 'britannica',
+            ('britannica_url', 'britannica_title'),
+            self._link_one_britannica,
+            # Britannica is only a fallback for entities without a wiki link
+            skip=lambda e: e.get('wikidata_url') or e.get('wikipedia_url')
+        )
+
+    def _link_one_britannica(self, entity):
+        """Look up a single entity on Britannica's search page.
+
+        Returns True when the lookup completed (matched or not), False on
+        a failed request so the empty result is not cached.
+        """
         import re
         import time
-        
-        for entity in entities:
-            # Skip if already has Wikidata or Wikipedia link
-            if entity.get('wikidata_url') or entity.get('wikipedia_url'):
-                continue
-                
-            try:
-                search_url = "https://www.britannica.com/search"
-                params = {'query': entity['text']}
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-                
-                response = requests.get(search_url, params=params, headers=headers, timeout=10)
-                if response.status_code == 200:
-                    # Look for article links
+
+        try:
+            search_url = "https://www.britannica.com/search"
+            params = {'query': entity['text']}
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            }
+
+            with self._host_limit('www.britannica.com'):
+                time.sleep(0.05)  # Politeness delay inside the host limit
+                response = self._session.get(search_url, params=params, headers=headers, timeout=10)
+            if response.status_code == 200:
+                entity_lower = entity.get('_lower') or entity['text'].lower()
+
+                try:
+                    # Prefer selectolax - a C-level HTML parser that is far
+                    # faster than regexing the whole page, and lets us stop
+                    # at the first matching article link
+                    from selectolax.parser import HTMLParser
+
+                    tree = HTMLParser(response.text)
+                    for anchor in tree.css('a[href^="/topic/"]'):
+                        link_text = anchor.text() or ''
+                        if (entity_lower in link_text.lower() or
+                            link_text.lower() in entity_lower):
+                            entity['britannica_url'] = f"https://www.britannica.com{anchor.attributes['href']}"
+                            entity['britannica_title'] = link_text.strip()
+                            break
+                except ImportError:
+                    # Fall back to regex scraping for article links
                     pattern = r'href="(/topic/[^"]*)"[^>]*>([^<]*)</a>'
                     matches = re.findall(pattern, response.text)
-                    
+
                     for url_path, link_text in matches:
-                        if (entity['text'].lower() in link_text.lower() or 
-                            link_text.lower() in entity['text'].lower()):
+                        if (entity_lower in link_text.lower() or
+                            link_text.lower() in entity_lower):
                             entity['britannica_url'] = f"https://www.britannica.com{url_path}"
                             entity['britannica_title'] = link_text.strip()
                             break
-                
-                time.sleep(0.3)  # Rate limiting
-            except Exception:
-                pass
-        
-        return entities
+                return True
+        except Exception:
+            pass
+        return False
 
     def _detect_geographical_context(self, text: str, entities: List[Dict[str, Any]]) -> List[str]:
         """
@@ -287,93 +724,48 @@ class EntityLinker:
         Returns:
             List of context strings to use for geocoding (e.g., ['UK', 'London', 'England'])
         """
-        import re
-        
         context_clues = []
         text_lower = text.lower()
-        
-        # Extract major cities/countries mentioned in the text
-        major_locations = {
-            # Countries
-            'uk': ['uk', 'united kingdom', 'britain', 'great britain'],
-            'usa': ['usa', 'united states', 'america', 'us '],
-            'canada': ['canada'],
-            'australia': ['australia'],
-            'france': ['france'],
-            'germany': ['germany'],
-            'italy': ['italy'],
-            'spain': ['spain'],
-            'japan': ['japan'],
-            'china': ['china'],
-            'india': ['india'],
-            
-            # Major cities that provide strong context
-            'london': ['london'],
-            'new york': ['new york', 'nyc', 'manhattan'],
-            'paris': ['paris'],
-            'tokyo': ['tokyo'],
-            'sydney': ['sydney'],
-            'toronto': ['toronto'],
-            'berlin': ['berlin'],
-            'rome': ['rome'],
-            'madrid': ['madrid'],
-            'beijing': ['beijing'],
-            'mumbai': ['mumbai'],
-            'los angeles': ['los angeles', 'la ', ' la,'],
-            'chicago': ['chicago'],
-            'boston': ['boston'],
-            'edinburgh': ['edinburgh'],
-            'glasgow': ['glasgow'],
-            'manchester': ['manchester'],
-            'birmingham': ['birmingham'],
-            'liverpool': ['liverpool'],
-            'bristol': ['bristol'],
-            'leeds': ['leeds'],
-            'cardiff': ['cardiff'],
-            'belfast': ['belfast'],
-            'dublin': ['dublin'],
-        }
-        
-        # Check for explicit mentions
-        for location, patterns in major_locations.items():
-            for pattern in patterns:
-                if pattern in text_lower:
+
+        # Check for explicit mentions of major cities/countries in the text.
+        # The automaton matches every keyword in one linear pass; otherwise
+        # fall back to scanning the keyword table with substring checks.
+        if self._loc_automaton is not None:
+            for _, (location, _) in self._loc_automaton.iter(text_lower):
+                if location not in context_clues:
                     context_clues.append(location)
-                    break
-        
-        # Extract from entities that are already identified as places
-        for entity in entities:
-            if entity['type'] in ['LOCATION', 'GPE', 'FACILITY']:
-                entity_lower = entity['text'].lower()
-                # Add major locations found in entities
-                for location, patterns in major_locations.items():
-                    if entity_lower in patterns or any(p in entity_lower for p in patterns):
-                        if location not in context_clues:
-                            context_clues.append(location)
-        
-        # Look for postal codes to infer country
-        postal_patterns = {
-            'uk': [
-                r'\b[A-Z]{1,2}\d{1,2}[A-Z]?\s*\d[A-Z]{2}\b',  # UK postcodes
-                r'\b[A-Z]{2}\d{1,2}\s*\d[A-Z]{2}\b'
-            ],
-            'usa': [
-                r'\b\d{5}(-\d{4})?\b'  # US ZIP codes
-            ],
-            'canada': [
-                r'\b[A-Z]\d[A-Z]\s*\d[A-Z]\d\b'  # Canadian postal codes
-            ]
-        }
-        
-        for country, patterns in postal_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text):
-                    if country not in context_clues:
-                        context_clues.append(country)
-                    break
-        
-        # Prioritize context (more specific first)
+        else:
+            for location, patterns in self.MAJOR_LOCATIONS.items():
+                for pattern in patterns:
+                    if pattern in text_lower:
+                        context_clues.append(location)
+                        break
+
         priority_order = ['london', 'new york', 'paris', 'tokyo', 'sydney', 'uk', 'usa', 'canada', 'australia', 'france', 'germany']
+
+        # Short-circuit: the result is capped at 3 clues, so once explicit
+        # mentions yield three (including a top-priority hit) the entity and
+        # postal scans - the expensive part on long texts - can be skipped
+        if not (len(context_clues) >= 3 and set(context_clues) & set(priority_order[:3])):
+            # Extract from entities that are already identified as places
+            for entity in entities:
+                if entity['type'] in ['LOCATION', 'GPE', 'FACILITY']:
+                    entity_lower = entity.get('_lower') or entity['text'].lower()
+                    # Add major locations found in entities
+                    for location, patterns in self.MAJOR_LOCATIONS.items():
+                        if entity_lower in patterns or any(p in entity_lower for p in patterns):
+                            if location not in context_clues:
+                                context_clues.append(location)
+
+            # Look for postal codes to infer country (patterns precompiled in __init__)
+            for country, patterns in self._postal_res:
+                for pattern in patterns:
+                    if pattern.search(text):
+                        if country not in context_clues:
+                            context_clues.append(country)
+                        break
+
+        # Prioritize context (more specific first)
         prioritized_context = []
         
         for priority_location in priority_order:
@@ -387,242 +779,217 @@ class EntityLinker:
         
         return prioritized_context[:3]  # Return top 3 context clues
 
-    def get_coordinates(self, entities):
-        """Enhanced coordinate lookup with geographical context detection."""
-        import requests
-        import time
-        
+    def get_coordinates(self, entities, text: str = ''):
+        """Enhanced coordinate lookup with geographical context detection.
+
+        The source text is passed in by the caller so context detection
+        depends only on the arguments, not on session state.
+        """
         # Detect geographical context from the full text
-        context_clues = self._detect_geographical_context(
-            st.session_state.get('processed_text', ''), 
-            entities
-        )
-        
+        context_clues = self._detect_geographical_context(text, entities)
+
         if context_clues:
             print(f"Detected geographical context: {', '.join(context_clues)}")
-        
-        place_types = ['LOCATION', 'GPE', 'FACILITY', 'ORGANIZATION', 'ADDRESS']
-        
+
+        place_types = _GEOCODABLE_TYPES
+        coordinate_fields = ('latitude', 'longitude', 'location_name',
+                             'geocoding_source', 'search_term_used')
+
+        # Group un-geocoded place entities by surface form so each unique
+        # form is looked up once and fanned out to repeated mentions
+        pending = {}
         for entity in entities:
             if entity['type'] in place_types:
                 # Skip if already has coordinates
                 if entity.get('latitude') is not None:
                     continue
-                
-                # Try geocoding with context
-                if self._try_contextual_geocoding(entity, context_clues):
-                    continue
-                    
-                # Fall back to original methods
-                if self._try_python_geocoding(entity):
-                    continue
-                
-                if self._try_openstreetmap(entity):
-                    continue
-                    
-                # If still no coordinates, try a more aggressive search
-                self._try_aggressive_geocoding(entity)
-        
+                key = (entity.get('_lower') or entity['text'].lower(), entity['type'])
+                pending.setdefault(key, []).append(entity)
+
+        if pending:
+            firsts = [group[0] for group in pending.values()]
+            self._geocode_entities(firsts, context_clues)
+
+            for group in pending.values():
+                resolved = {field: group[0][field]
+                            for field in coordinate_fields
+                            if field in group[0]}
+                for duplicate in group[1:]:
+                    duplicate.update(resolved)
+
         return entities
-    
-    def _try_contextual_geocoding(self, entity, context_clues):
-        """Try geocoding with geographical context."""
-        import requests
-        import time
-        
-        if not context_clues:
-            return False
-        
-        # Create context-aware search terms
-        search_variations = [entity['text']]
-        
-        # Add context to search terms
-        for context in context_clues:
-            context_mapping = {
-                'uk': ['UK', 'United Kingdom', 'England', 'Britain'],
-                'usa': ['USA', 'United States', 'US'],
-                'canada': ['Canada'],
-                'australia': ['Australia'],
-                'france': ['France'],
-                'germany': ['Germany'],
-                'london': ['London, UK', 'London, England'],
-                'new york': ['New York, USA', 'New York, NY'],
-                'paris': ['Paris, France'],
-                'tokyo': ['Tokyo, Japan'],
-                'sydney': ['Sydney, Australia'],
-            }
-            
-            context_variants = context_mapping.get(context, [context])
-            for variant in context_variants:
-                search_variations.append(f"{entity['text']}, {variant}")
-        
-        # Remove duplicates while preserving order
-        search_variations = list(dict.fromkeys(search_variations))
-        
-        # Try geopy first with context
+
+    def _geocode_entities(self, entities, context_clues):
+        """
+        Geocode a list of entities in place.
+
+        When httpx is installed, each round of candidate queries is fetched
+        from Nominatim concurrently over one connection (bounded by a
+        semaphore for rate-limit etiquette); otherwise entities fall back to
+        the serial cached provider chain.
+        """
         try:
-            from geopy.geocoders import Nominatim
-            from geopy.exc import GeocoderTimedOut, GeocoderServiceError
-            
-            geocoder = Nominatim(user_agent="EntityLinker/1.0", timeout=10)
-            
-            for search_term in search_variations[:5]:  # Try top 5 variations
-                try:
-                    location = geocoder.geocode(search_term, timeout=10)
-                    if location:
-                        entity['latitude'] = location.latitude
-                        entity['longitude'] = location.longitude
-                        entity['location_name'] = location.address
-                        entity['geocoding_source'] = f'geopy_contextual'
+            import httpx  # noqa: F401
+        except ImportError:
+            # Serial fallback through the cached provider chain
+            for entity in entities:
+                for search_term in self._geocode_candidates(entity, context_clues):
+                    result = self._geocode(search_term)
+                    if result:
+                        entity.update(result)
                         entity['search_term_used'] = search_term
-                        return True
-                    
-                    time.sleep(0.2)  # Rate limiting
-                except (GeocoderTimedOut, GeocoderServiceError):
+                        break
+            return
+
+        import asyncio
+
+        # Try candidate queries in rounds: every entity's next candidate is
+        # fetched in one concurrent batch, and resolved entities drop out
+        remaining = [(e, self._geocode_candidates(e, context_clues)) for e in entities]
+        round_no = 0
+        while remaining:
+            batch = [(e, cands[round_no]) for e, cands in remaining if round_no < len(cands)]
+            if not batch:
+                break
+
+            unique_queries = list(dict.fromkeys(query for _, query in batch))
+            responses = asyncio.run(self._geocode_all(unique_queries))
+            results = dict(zip(unique_queries, responses))
+
+            next_remaining = []
+            for entity, cands in remaining:
+                if round_no >= len(cands):
                     continue
-                    
+                result = results.get(cands[round_no])
+                if result:
+                    entity.update(result)
+                    entity['search_term_used'] = cands[round_no]
+                else:
+                    next_remaining.append((entity, cands))
+            remaining = next_remaining
+            round_no += 1
+
+    async def _geocode_all(self, queries):
+        """Fetch Nominatim results for all queries over one async client."""
+        import asyncio
+        import httpx
+
+        semaphore = asyncio.Semaphore(2)  # Nominatim rate-limit etiquette
+
+        async def fetch(client, query):
+            async with semaphore:
+                try:
+                    response = await client.get(
+                        _OSM_URL,
+                        params={**_OSM_BASE_PARAMS, 'q': query}
+                    )
+                    if response.status_code == 200:
+                        data = _parse_json(response)
+                        if data:
+                            result = data[0]
+                            return {
+                                'latitude': float(result['lat']),
+                                'longitude': float(result['lon']),
+                                'location_name': result['display_name'],
+                                'geocoding_source': 'openstreetmap_batch'
+                            }
+                except Exception:
+                    pass
+                return None
+
+        try:
+            # HTTP/2 multiplexes all requests over a single connection
+            client = httpx.AsyncClient(
+                http2=True, timeout=10, headers=_OSM_HEADERS,
+                follow_redirects=True)
         except ImportError:
-            pass
-        
-        # Fall back to OpenStreetMap with context
-        for search_term in search_variations[:3]:  # Try top 3 with OSM
-            try:
-                url = "https://nominatim.openstreetmap.org/search"
-                params = {
-                    'q': search_term,
-                    'format': 'json',
-                    'limit': 1,
-                    'addressdetails': 1
-                }
-                headers = {'User-Agent': 'EntityLinker/1.0'}
-            
-                response = requests.get(url, params=params, headers=headers, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    if data:
-                        result = data[0]
-                        entity['latitude'] = float(result['lat'])
-                        entity['longitude'] = float(result['lon'])
-                        entity['location_name'] = result['display_name']
-                        entity['geocoding_source'] = f'openstreetmap_contextual'
-                        entity['search_term_used'] = search_term
-                        return True
-            
-                time.sleep(0.3)  # Rate limiting
-            except Exception:
-                continue
-        
-        return False
-    
-    def _try_python_geocoding(self, entity):
-        """Try Python geocoding libraries (geopy) - original method."""
+            # h2 extra not installed - plain HTTP/1.1 with keep-alive
+            client = httpx.AsyncClient(
+                timeout=10, headers=_OSM_HEADERS, follow_redirects=True)
+
+        async with client:
+            return await asyncio.gather(*(fetch(client, query) for query in queries))
+
+    def _geocode_candidates(self, entity, context_clues):
+        """Build the ordered list of query strings to try for an entity."""
+        candidates = []
+
+        # Context-aware search terms come first for accuracy
+        for context in context_clues:
+            for variant in self.CONTEXT_EXPANSIONS.get(context, [context]):
+                candidates.append(f"{entity['text']}, {variant}")
+
+        # The bare entity name
+        candidates.append(entity['text'])
+
+        # Aggressive variations as a last resort
+        candidates.extend([
+            f"{entity['text']}, UK",  # Add country for UK places
+            f"{entity['text']}, England",
+            f"{entity['text']}, Scotland",
+            f"{entity['text']}, Wales",
+            f"{entity['text']} city",
+            f"{entity['text']} town"
+        ])
+
+        # Remove duplicates while preserving order, and cap attempts
+        return list(dict.fromkeys(candidates))[:10]
+
+    def _geocode_uncached(self, query: str):
+        """
+        Geocode a single query string through the provider chain.
+
+        Tries the shared geopy geocoders (Nominatim, then ArcGIS) before
+        falling back to the Nominatim HTTP API directly. Returns a dict of
+        coordinate fields, or None if no provider found the query. Wrapped
+        with lru_cache in __init__ so repeated queries never hit the network.
+        """
+        import time
+
+        # Try geopy providers first
         try:
-            from geopy.geocoders import Nominatim, ArcGIS
             from geopy.exc import GeocoderTimedOut, GeocoderServiceError
-            
-            geocoders = [
-                ('nominatim', Nominatim(user_agent="EntityLinker/1.0", timeout=10)),
-                ('arcgis', ArcGIS(timeout=10)),
-            ]
-            
-            for name, geocoder in geocoders:
+
+            for name, geocoder in [('nominatim', self._nominatim), ('arcgis', self._arcgis)]:
+                if geocoder is None:
+                    continue
                 try:
-                    location = geocoder.geocode(entity['text'], timeout=10)
+                    time.sleep(0.1)  # Rate limiting
+                    location = geocoder.geocode(query, timeout=10)
                     if location:
-                        entity['latitude'] = location.latitude
-                        entity['longitude'] = location.longitude
-                        entity['location_name'] = location.address
-                        entity['geocoding_source'] = f'geopy_{name}'
-                        return True
-                        
-                    time.sleep(0.3)
+                        return {
+                            'latitude': location.latitude,
+                            'longitude': location.longitude,
+                            'location_name': location.address,
+                            'geocoding_source': f'geopy_{name}'
+                        }
                 except (GeocoderTimedOut, GeocoderServiceError):
                     continue
-                except Exception as e:
-                    continue
-                        
         except ImportError:
             pass
-        except Exception as e:
-            pass
-        
-        return False
-    
-    def _try_openstreetmap(self, entity):
-        """Fall back to direct OpenStreetMap Nominatim API."""
+
+        # Fall back to direct OpenStreetMap Nominatim API
         try:
-            url = "https://nominatim.openstreetmap.org/search"
-            params = {
-                'q': entity['text'],
-                'format': 'json',
-                'limit': 1,
-                'addressdetails': 1
-            }
-            headers = {'User-Agent': 'EntityLinker/1.0'}
-        
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            params = {**_OSM_BASE_PARAMS, 'q': query}
+
+            with self._host_limit('nominatim.openstreetmap.org'):
+                time.sleep(0.1)  # Rate limiting
+                response = self._session.get(_OSM_URL, params=params, headers=_OSM_HEADERS, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 if data:
                     result = data[0]
-                    entity['latitude'] = float(result['lat'])
-                    entity['longitude'] = float(result['lon'])
-                    entity['location_name'] = result['display_name']
-                    entity['geocoding_source'] = 'openstreetmap'
-                    return True
-        
-            time.sleep(0.3)  # Rate limiting
+                    return {
+                        'latitude': float(result['lat']),
+                        'longitude': float(result['lon']),
+                        'location_name': result['display_name'],
+                        'geocoding_source': 'openstreetmap'
+                    }
         except Exception as e:
             # Debug: print the error for troubleshooting
-            print(f"OpenStreetMap geocoding failed for {entity['text']}: {e}")
-            pass
-        
-        return False
-    
-    def _try_aggressive_geocoding(self, entity):
-        """Try more aggressive geocoding with different search terms."""
-        import requests
-        import time
-        
-        # Try variations of the entity name
-        search_variations = [
-            entity['text'],
-            f"{entity['text']}, UK",  # Add country for UK places
-            f"{entity['text']}, England",
-            f"{entity['text']}, Scotland",
-            f"{entity['text']}, Wales",
-            f"{entity['text']} city",
-            f"{entity['text']} town"
-        ]
-        
-        for search_term in search_variations:
-            try:
-                url = "https://nominatim.openstreetmap.org/search"
-                params = {
-                    'q': search_term,
-                    'format': 'json',
-                    'limit': 1,
-                    'addressdetails': 1
-                }
-                headers = {'User-Agent': 'EntityLinker/1.0'}
-            
-                response = requests.get(url, params=params, headers=headers, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    if data:
-                        result = data[0]
-                        entity['latitude'] = float(result['lat'])
-                        entity['longitude'] = float(result['lon'])
-                        entity['location_name'] = result['display_name']
-                        entity['geocoding_source'] = f'openstreetmap_aggressive'
-                        entity['search_term_used'] = search_term
-                        return True
-            
-                time.sleep(0.2)  # Rate limiting between attempts
-            except Exception:
-                continue
-        
-        return False
+            print(f"OpenStreetMap geocoding failed for {query}: {e}")
+
+        return None
 
     def _is_valid_entity(self, entity_text: str, entity_type: str, flair_span) -> bool:
         """Validate an entity from Flair."""
@@ -646,25 +1013,16 @@ class EntityLinker:
 
     def _extract_addresses(self, text: str):
         """Extract address patterns that NER might miss."""
-        import re
-        addresses = []
-        
-        # Patterns for different address formats
-        address_patterns = [
-            r'\b\d{1,4}[-–]\d{1,4}\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Road|Street|Avenue|Lane|Drive|Way|Place|Square|Gardens)\b',
-            r'\b\d{1,4}\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Road|Street|Avenue|Lane|Drive|Way|Place|Square|Gardens)\b'
+        return [
+            {
+                'text': match.group(),
+                'type': 'ADDRESS',
+                'start': match.start(),
+                'end': match.end(),
+                '_lower': match.group().lower()  # Cached for the linkers
+            }
+            for match in self._address_re.finditer(text)
         ]
-        
-        for pattern in address_patterns:
-            for match in re.finditer(pattern, text):
-                addresses.append({
-                    'text': match.group(),
-                    'type': 'ADDRESS',
-                    'start': match.start(),
-                    'end': match.end()
-                })
-        
-        return addresses
 
     def _remove_duplicate_entities(self, entities):
         """Remove exact duplicate entities based on text and type."""
@@ -683,27 +1041,20 @@ class EntityLinker:
     
     def _remove_overlapping_entities(self, entities):
         """Remove overlapping entities, keeping the longest ones."""
-        entities.sort(key=lambda x: x['start'])
-        
-        filtered = []
+        # Sort by start, with longer spans first on ties, then sweep once
+        # left to right comparing each entity against the last kept span
+        entities.sort(key=lambda e: (e['start'], -(e['end'] - e['start'])))
+
+        kept = []
         for entity in entities:
-            overlaps = False
-            for existing in filtered[:]:  # Create a copy to safely modify during iteration
-                # Check if entities overlap
-                if (entity['start'] < existing['end'] and entity['end'] > existing['start']):
-                    # If current entity is longer, remove the existing one
-                    if len(entity['text']) > len(existing['text']):
-                        filtered.remove(existing)
-                        break
-                    else:
-                        # Current entity is shorter, skip it
-                        overlaps = True
-                        break
-            
-            if not overlaps:
-                filtered.append(entity)
-        
-        return filtered
+            if kept and entity['start'] < kept[-1]['end']:
+                # Overlap with the previous kept entity - longest wins
+                if len(entity['text']) > len(kept[-1]['text']):
+                    kept[-1] = entity
+                continue
+            kept.append(entity)
+
+        return kept
     
     def _remove_duplicate_entities(self, entities):
         """Remove exact duplicate entities based on text and type."""
@@ -731,28 +1082,9 @@ class EntityLinker:
         # Step 1: Remove exact positional duplicates (same text, same start/end position)
         entities = self._remove_exact_positional_duplicates(entities)
         
-        # Step 2: Handle overlapping entities (keep longer ones)
-        entities.sort(key=lambda x: x['start'])
-        
-        filtered = []
-        for entity in entities:
-            overlaps = False
-            for existing in filtered[:]:  # Create a copy to safely modify during iteration
-                # Check if entities overlap in position
-                if (entity['start'] < existing['end'] and entity['end'] > existing['start']):
-                    # If current entity is longer, remove the existing one
-                    if len(entity['text']) > len(existing['text']):
-                        filtered.remove(existing)
-                        break
-                    else:
-                        # Current entity is shorter, skip it
-                        overlaps = True
-                        break
-            
-            if not overlaps:
-                filtered.append(entity)
-        
-        return filtered
+        # Step 2: Handle overlapping entities (keep longer ones) with the
+        # same linear sweep used by _remove_overlapping_entities
+        return self._remove_overlapping_entities(entities)
     
     def _remove_exact_positional_duplicates(self, entities):
         """Remove entities that are identical in text, type, and position."""
@@ -789,128 +1121,440 @@ class EntityLinker:
 
     def link_to_wikidata(self, entities):
         """Add basic Wikidata linking."""
-        import requests
-        import time
-        
+        resolved = {}
+        pending = {}  # cache key -> entities still needing a lookup
+
         for entity in entities:
+            key = self._link_cache_key('wikidata', entity)
+            cached = resolved.get(key)
+            if cached is None:
+                cached = self._link_cache.get(key)
+            if cached is not None:
+                entity.update(cached)
+                continue
+            pending.setdefault(key, []).append(entity)
+
+        if not pending:
+            return entities
+
+        # Resolve as many names as possible with batched title queries
+        # (50 titles per request), then fall back to per-entity search
+        # for whatever the batch could not match
+        names = {key: group[0]['text'] for key, group in pending.items()}
+        batch_results = self._wikidata_batch(list(dict.fromkeys(names.values())))
+
+        unresolved = []
+        for key, group in pending.items():
+            hit = batch_results.get(names[key].lower())
+            if hit:
+                group[0].update(hit)
+            else:
+                unresolved.append(group[0])
+
+        failed = set()
+        if unresolved:
+            for entity, completed in zip(
+                    unresolved,
+                    self._executor.map(self._link_one_wikidata, unresolved)):
+                if not completed:
+                    failed.add(id(entity))
+
+        fields = ('wikidata_url', 'wikidata_description')
+        for key, group in pending.items():
+            entity = group[0]
+            if id(entity) in failed and not any(field in entity for field in fields):
+                # The fallback lookup errored and nothing resolved - leave
+                # the key uncached so the next run retries instead of
+                # finding an empty entry for the next 7 days
+                resolved[key] = {}
+                continue
+            result = self._store_link_result(key, entity, fields)
+            resolved[key] = result
+            for duplicate in group[1:]:
+                duplicate.update(result)
+
+        return entities
+
+    def _wikidata_batch(self, names):
+        """
+        Resolve entity names to Wikidata QIDs in batched title queries.
+
+        Uses the Wikipedia query API with pipe-joined titles (up to 50 per
+        request) and the wikibase_item page property, then fetches English
+        descriptions for the resolved QIDs with batched wbgetentities calls
+        (50 ids per request), so N names cost a handful of HTTP round-trips
+        instead of N.
+        """
+        results = {}
+        url = "https://en.wikipedia.org/w/api.php"
+        headers = {'User-Agent': 'EntityLinker/1.0'}
+
+        for i in range(0, len(names), 50):
+            chunk = names[i:i + 50]
             try:
-                url = "https://www.wikidata.org/w/api.php"
                 params = {
-                    'action': 'wbsearchentities',
+                    'action': 'query',
                     'format': 'json',
-                    'search': entity['text'],
-                    'language': 'en',
-                    'limit': 1,
-                    'type': 'item'
+                    'prop': 'pageprops',
+                    'ppprop': 'wikibase_item',
+                    'redirects': 1,
+                    'titles': '|'.join(chunk)
                 }
-                
-                response = requests.get(url, params=params, timeout=5)
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('search') and len(data['search']) > 0:
-                        result = data['search'][0]
-                        entity['wikidata_url'] = f"http://www.wikidata.org/entity/{result['id']}"
-                        entity['wikidata_description'] = result.get('description', '')
-                
-                time.sleep(0.1)  # Rate limiting
+
+                with self._host_limit('en.wikipedia.org'):
+                    response = self._session.get(url, params=params, headers=headers, timeout=10)
+                if response.status_code != 200:
+                    continue
+
+                query = _parse_json(response).get('query', {})
+
+                # The API normalizes and redirects titles - map each
+                # returned page back to the name that was asked for
+                back = {}
+                for mapping in query.get('normalized', []):
+                    back[mapping['to']] = mapping['from']
+                for mapping in query.get('redirects', []):
+                    back[mapping['to']] = back.get(mapping['from'], mapping['from'])
+
+                for page in query.get('pages', {}).values():
+                    qid = page.get('pageprops', {}).get('wikibase_item')
+                    if not qid:
+                        continue
+                    title = page.get('title', '')
+                    original = back.get(title, title)
+                    results[original.lower()] = {
+                        'wikidata_url': f"http://www.wikidata.org/entity/{qid}"
+                    }
             except Exception:
-                pass  # Continue if API call fails
-        
-        return entities
+                continue  # Fall back to per-entity search for this chunk
+
+        # Second stage: fetch English descriptions for all resolved QIDs
+        # with batched wbgetentities calls
+        qid_map = {}
+        for result in results.values():
+            qid = result['wikidata_url'].rsplit('/', 1)[-1]
+            qid_map.setdefault(qid, []).append(result)
+
+        qids = list(qid_map)
+        for i in range(0, len(qids), 50):
+            chunk = qids[i:i + 50]
+            try:
+                params = {
+                    'action': 'wbgetentities',
+                    'ids': '|'.join(chunk),
+                    'props': 'descriptions',
+                    'languages': 'en',
+                    'format': 'json'
+                }
+
+                with self._host_limit('www.wikidata.org'):
+                    response = self._session.get(
+                        "https://www.wikidata.org/w/api.php",
+                        params=params, headers=headers, timeout=10)
+                if response.status_code != 200:
+                    continue
+
+                for qid, entry in _parse_json(response).get('entities', {}).items():
+                    description = entry.get('descriptions', {}).get('en', {}).get('value', '')
+                    for result in qid_map.get(qid, []):
+                        result['wikidata_description'] = description
+            except Exception:
+                continue  # Entities keep their URL without a description
+
+        return results
+
+    def _link_one_wikidata(self, entity):
+        """Look up a single entity via the Wikidata search API.
+
+        Returns True when the lookup completed (matched or not), False on
+        a failed request so the empty result is not cached.
+        """
+        import time
+
+        try:
+            url = "https://www.wikidata.org/w/api.php"
+            params = {
+                'action': 'wbsearchentities',
+                'format': 'json',
+                'search': entity['text'],
+                'language': 'en',
+                'limit': 1,
+                'type': 'item'
+            }
+
+            with self._host_limit('www.wikidata.org'):
+                time.sleep(0.05)  # Politeness delay inside the host limit
+                response = self._session.get(url, params=params, timeout=5)
+            if response.status_code == 200:
+                data = _parse_json(response)
+                if data.get('search') and len(data['search']) > 0:
+                    result = data['search'][0]
+                    entity['wikidata_url'] = f"http://www.wikidata.org/entity/{result['id']}"
+                    entity['wikidata_description'] = result.get('description', '')
+                return True
+        except Exception:
+            pass  # Continue if API call fails
+        return False
 
     def link_to_wikipedia(self, entities):
         """Add Wikipedia linking for entities without Wikidata links."""
-        import requests
+        return self._link_entities(
+            entities, 'wikipedia',
+            ('wikipedia_url', 'wikipedia_title', 'wikipedia_description'),
+            self._link_one_wikipedia,
+            skip=lambda e: e.get('wikidata_url')
+        )
+
+    def _link_one_wikipedia(self, entity):
+        """Look up a single entity via Wikipedia's search API.
+
+        Returns True when the lookup completed (matched or not), False on
+        a failed request so the empty result is not cached.
+        """
         import time
         import urllib.parse
-        
-        for entity in entities:
-            # Skip if already has Wikidata link
-            if entity.get('wikidata_url'):
-                continue
-                
-            try:
-                # Use Wikipedia's search API
-                search_url = "https://en.wikipedia.org/w/api.php"
-                search_params = {
-                    'action': 'query',
-                    'format': 'json',
-                    'list': 'search',
-                    'srsearch': entity['text'],
-                    'srlimit': 1
-                }
-                
-                headers = {'User-Agent': 'EntityLinker/1.0'}
-                response = requests.get(search_url, params=search_params, headers=headers, timeout=10)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('query', {}).get('search'):
-                        # Get the first search result
-                        result = data['query']['search'][0]
-                        page_title = result['title']
-                        
-                        # Create Wikipedia URL
-                        encoded_title = urllib.parse.quote(page_title.replace(' ', '_'))
-                        entity['wikipedia_url'] = f"https://en.wikipedia.org/wiki/{encoded_title}"
-                        entity['wikipedia_title'] = page_title
-                        
-                        # Get a snippet/description from the search result
-                        if result.get('snippet'):
-                            # Clean up the snippet (remove HTML tags)
-                            import re
-                            snippet = re.sub(r'<[^>]+>', '', result['snippet'])
-                            entity['wikipedia_description'] = snippet[:200] + "..." if len(snippet) > 200 else snippet
-                
-                time.sleep(0.2)  # Rate limiting
-            except Exception as e:
-                print(f"Wikipedia linking failed for {entity['text']}: {e}")
-                pass
-        
-        return entities
+
+        try:
+            # Use Wikipedia's search API
+            search_url = "https://en.wikipedia.org/w/api.php"
+            search_params = {
+                'action': 'query',
+                'format': 'json',
+                'list': 'search',
+                'srsearch': entity['text'],
+                'srlimit': 1
+            }
+
+            headers = {'User-Agent': 'EntityLinker/1.0'}
+            with self._host_limit('en.wikipedia.org'):
+                time.sleep(0.05)  # Politeness delay inside the host limit
+                response = self._session.get(search_url, params=search_params, headers=headers, timeout=10)
+
+            if response.status_code == 200:
+                data = _parse_json(response)
+                if data.get('query', {}).get('search'):
+                    # Get the first search result
+                    result = data['query']['search'][0]
+                    page_title = result['title']
+
+                    # Create Wikipedia URL
+                    encoded_title = urllib.parse.quote(page_title.replace(' ', '_'))
+                    entity['wikipedia_url'] = f"https://en.wikipedia.org/wiki/{encoded_title}"
+                    entity['wikipedia_title'] = page_title
+
+                    # Get a snippet/description from the search result
+                    if result.get('snippet'):
+                        # Clean up the snippet (remove HTML tags)
+                        snippet = EntityLinker._HTML_TAG_RE.sub('', result['snippet'])
+                        entity['wikipedia_description'] = (snippet[:197] + '...') if len(snippet) > 200 else snippet
+                return True
+        except Exception as e:
+            print(f"Wikipedia linking failed for {entity['text']}: {e}")
+        return False
 
     def link_to_openstreetmap(self, entities):
         """Add OpenStreetMap links to addresses."""
-        import requests
+        # Only ADDRESS entities without a link need a lookup
+        addresses = [e for e in entities
+                     if e['type'] == 'ADDRESS' and not e.get('openstreetmap_url')]
+        if not addresses:
+            return entities
+
+        # Dedupe identical address strings: look each unique form up once
+        # and broadcast the result to repeated mentions afterwards
+        groups = {}
+        for entity in addresses:
+            key = entity.get('_lower') or entity['text'].lower()
+            groups.setdefault(key, []).append(entity)
+        firsts = [group[0] for group in groups.values()]
+
+        try:
+            import httpx  # noqa: F401
+            import asyncio
+            asyncio.run(self._link_to_osm_async(firsts))
+        except ImportError:
+            # Serial fallback through the shared session
+            for entity in firsts:
+                self._link_one_openstreetmap(entity)
+
+        osm_fields = ('openstreetmap_url', 'openstreetmap_display_name',
+                      'latitude', 'longitude', 'location_name')
+        for group in groups.values():
+            resolved = {field: group[0][field]
+                        for field in osm_fields if field in group[0]}
+            for duplicate in group[1:]:
+                duplicate.update(resolved)
+
+        return entities
+
+    def _apply_osm_result(self, entity, result):
+        """Copy a Nominatim result onto an ADDRESS entity."""
+        # Create OpenStreetMap link
+        lat = result['lat']
+        lon = result['lon']
+        entity['openstreetmap_url'] = f"https://www.openstreetmap.org/?mlat={lat}&mlon={lon}&zoom=18"
+        entity['openstreetmap_display_name'] = result['display_name']
+
+        # Also add coordinates
+        entity['latitude'] = float(lat)
+        entity['longitude'] = float(lon)
+        entity['location_name'] = result['display_name']
+
+    def _link_one_openstreetmap(self, entity):
+        """Look up a single address on Nominatim via the shared session."""
         import time
-        
-        for entity in entities:
-            # Only process ADDRESS entities
-            if entity['type'] != 'ADDRESS':
-                continue
-                
-            try:
-                # Search OpenStreetMap Nominatim for the address
-                url = "https://nominatim.openstreetmap.org/search"
-                params = {
-                    'q': entity['text'],
-                    'format': 'json',
-                    'limit': 1,
-                    'addressdetails': 1
-                }
-                headers = {'User-Agent': 'EntityLinker/1.0'}
-                
-                response = requests.get(url, params=params, headers=headers, timeout=5)
+
+        try:
+            # Search OpenStreetMap Nominatim for the address
+            params = {**_OSM_BASE_PARAMS, 'q': entity['text']}
+
+            with self._host_limit('nominatim.openstreetmap.org'):
+                time.sleep(0.1)  # Rate limiting
+                response = self._session.get(_OSM_URL, params=params, headers=_OSM_HEADERS, timeout=5)
+            if response.status_code == 200:
+                data = _parse_json(response)
+                if data:
+                    self._apply_osm_result(entity, data[0])
+        except Exception:
+            pass
+
+    async def _link_to_osm_async(self, entities):
+        """Fan address lookups out over one async client."""
+        import asyncio
+        import httpx
+
+        semaphore = asyncio.Semaphore(1)  # Nominatim rate-limit etiquette
+
+        async def fetch(client, entity):
+            async with semaphore:
+                response = await client.get(
+                    _OSM_URL,
+                    params={**_OSM_BASE_PARAMS, 'q': entity['text']}
+                )
                 if response.status_code == 200:
-                    data = response.json()
+                    data = _parse_json(response)
                     if data:
-                        result = data[0]
-                        # Create OpenStreetMap link
-                        lat = result['lat']
-                        lon = result['lon']
-                        entity['openstreetmap_url'] = f"https://www.openstreetmap.org/?mlat={lat}&mlon={lon}&zoom=18"
-                        entity['openstreetmap_display_name'] = result['display_name']
-                        
-                        # Also add coordinates
-                        entity['latitude'] = float(lat)
-                        entity['longitude'] = float(lon)
-                        entity['location_name'] = result['display_name']
-                
-                time.sleep(0.2)  # Rate limiting
-            except Exception:
-                pass
-        
-        return entities
+                        self._apply_osm_result(entity, data[0])
+
+        try:
+            # HTTP/2 multiplexes all requests over a single connection
+            client = httpx.AsyncClient(
+                http2=True, timeout=5, headers=_OSM_HEADERS,
+                follow_redirects=True)
+        except ImportError:
+            client = httpx.AsyncClient(
+                timeout=5, headers=_OSM_HEADERS, follow_redirects=True)
+
+        async with client:
+            # return_exceptions so one failed or rate-limited lookup
+            # doesn't abort the rest of the batch
+            await asyncio.gather(
+                *(fetch(client, entity) for entity in entities),
+                return_exceptions=True
+            )
+
+
+@st.cache_data(show_spinner=False)
+def _build_jsonld(text_hash: str, title: str, _text: str,
+                  _entities: List[Dict[str, Any]]) -> str:
+    """
+    Build the JSON-LD export document for a processed text.
+
+    Cached on (text_hash, title) so the document is only rebuilt when the
+    underlying text changes, not on every Streamlit rerun. The text and
+    entities are passed with underscore names to skip hashing them - the
+    text hash already identifies them.
+    """
+    json_data = {
+        "@context": "http://schema.org/",
+        "@type": "TextDigitalDocument",
+        "text": _text,
+        "dateCreated": str(pd.Timestamp.now().isoformat()),
+        "title": title,
+        "entities": []
+    }
+
+    # Format entities for JSON-LD
+    for entity in _entities:
+        entity_data = {
+            "name": entity['text'],
+            "type": entity['type'],
+            "startOffset": entity['start'],
+            "endOffset": entity['end']
+        }
+
+        if entity.get('wikidata_url'):
+            entity_data['sameAs'] = entity['wikidata_url']
+
+        if entity.get('wikidata_description'):
+            entity_data['description'] = entity['wikidata_description']
+        elif entity.get('wikipedia_description'):
+            entity_data['description'] = entity['wikipedia_description']
+        elif entity.get('britannica_title'):
+            entity_data['description'] = entity['britannica_title']
+
+        if entity.get('latitude') and entity.get('longitude'):
+            entity_data['geo'] = {
+                "@type": "GeoCoordinates",
+                "latitude": entity['latitude'],
+                "longitude": entity['longitude']
+            }
+            if entity.get('location_name'):
+                entity_data['geo']['name'] = entity['location_name']
+
+        for url_field in ('wikipedia_url', 'britannica_url', 'openstreetmap_url'):
+            url = entity.get(url_field)
+            if not url:
+                continue
+            if 'sameAs' in entity_data:
+                if isinstance(entity_data['sameAs'], str):
+                    entity_data['sameAs'] = [entity_data['sameAs'], url]
+                else:
+                    entity_data['sameAs'].append(url)
+            else:
+                entity_data['sameAs'] = url
+
+        json_data['entities'].append(entity_data)
+
+    if orjson is not None:
+        return orjson.dumps(json_data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(json_data, indent=2, ensure_ascii=False)
+
+
+@st.cache_data(show_spinner=False)
+def _build_export_html(text_hash: str, title: str, entity_count: int,
+                       _html_content: str) -> str:
+    """Build the standalone HTML export page, cached per processed text."""
+    return f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Entity Analysis: {title}</title>
+        <meta charset="utf-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1">
+        <style>
+            body {{ font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px; }}
+            .content {{ background: white; padding: 20px; border: 1px solid #ddd; border-radius: 5px; line-height: 1.6; }}
+            .header {{ background: #f5f5f5; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
+            @media (max-width: 768px) {{
+                body {{ padding: 10px; }}
+                .content {{ padding: 15px; }}
+                .header {{ padding: 10px; }}
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="header">
+            <h1>Entity Analysis: {title}</h1>
+            <p>Generated on {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+            <p>Found {entity_count} entities</p>
+        </div>
+        <div class="content">
+            {_html_content}
+        </div>
+    </body>
+    </html>
+    """
 
 
 class StreamlitEntityLinker:
@@ -920,12 +1564,29 @@ class StreamlitEntityLinker:
     Provides a web interface with additional visualization and
     export capabilities for entity analysis.
     """
-    
+
+    # html.escape replacements, applied in one str.translate pass when
+    # building the highlighted HTML
+    _ESCAPE_TABLE = {
+        38: '&amp;',   # &
+        60: '&lt;',    # <
+        62: '&gt;',    # >
+        34: '&quot;',  # "
+        39: '&#x27;',  # '
+    }
+
     def __init__(self):
         """Initialize the Streamlit Entity Linker."""
         self.entity_linker = EntityLinker()
-        
-        # Initialize session state
+
+    @staticmethod
+    def _init_session_state():
+        """Seed session-state defaults for a new browser session.
+
+        Kept out of __init__ so the app object can be shared across
+        sessions via st.cache_resource while each session still gets
+        its own defaults.
+        """
         if 'entities' not in st.session_state:
             st.session_state.entities = []
         if 'processed_text' not in st.session_state:
@@ -936,35 +1597,33 @@ class StreamlitEntityLinker:
             st.session_state.analysis_title = "text_analysis"
         if 'last_processed_hash' not in st.session_state:
             st.session_state.last_processed_hash = ""
+        if 'last_result' not in st.session_state:
+            st.session_state.last_result = None
 
     @st.cache_data
     def cached_extract_entities(_self, text: str) -> List[Dict[str, Any]]:
         """Cached entity extraction to avoid reprocessing same text."""
         return _self.entity_linker.extract_entities(text)
     
-    @st.cache_data  
-    def cached_link_to_wikidata(_self, entities_json: str) -> str:
-        """Cached Wikidata linking."""
-        import json
-        entities = json.loads(entities_json)
-        linked_entities = _self.entity_linker.link_to_wikidata(entities)
-        return json.dumps(linked_entities)
-    
+    # The cached linkers take the entity list directly - the underscore
+    # prefix tells Streamlit not to hash it, and the text fingerprint keys
+    # the cache instead (entities are deterministic given the text). Each
+    # call works on shallow copies so concurrent linkers stay independent.
+
+    @st.cache_data
+    def cached_link_to_wikidata(_self, _entities: List[Dict[str, Any]], text_hash: str) -> List[Dict[str, Any]]:
+        """Cached Wikidata linking, keyed on the text fingerprint."""
+        return _self.entity_linker.link_to_wikidata([dict(e) for e in _entities])
+
     @st.cache_data
-    def cached_link_to_britannica(_self, entities_json: str) -> str:
-        """Cached Britannica linking."""
-        import json
-        entities = json.loads(entities_json)
-        linked_entities = _self.entity_linker.link_to_britannica(entities)
-        return json.dumps(linked_entities)
+    def cached_link_to_britannica(_self, _entities: List[Dict[str, Any]], text_hash: str) -> List[Dict[str, Any]]:
+        """Cached Britannica linking, keyed on the text fingerprint."""
+        return _self.entity_linker.link_to_britannica([dict(e) for e in _entities])
 
     @st.cache_data
-    def cached_link_to_wikipedia(_self, entities_json: str) -> str:
-        """Cached Wikipedia linking."""
-        import json
-        entities = json.loads(entities_json)
-        linked_entities = _self.entity_linker.link_to_wikipedia(entities)
-        return json.dumps(linked_entities)
+    def cached_link_to_wikipedia(_self, _entities: List[Dict[str, Any]], text_hash: str) -> List[Dict[str, Any]]:
+        """Cached Wikipedia linking, keyed on the text fingerprint."""
+        return _self.entity_linker.link_to_wikipedia([dict(e) for e in _entities])
 
     def render_header(self):
         """Render the application header with logo."""
@@ -1090,102 +1749,39 @@ class StreamlitEntityLinker:
     def process_text(self, text: str, title: str):
         """
         Process the input text using the EntityLinker.
-        
+
         Args:
             text: Input text to process
             title: Analysis title
         """
-        if not text.strip():
+        if not text or text.isspace():
             st.warning("Please enter some text to analyze.")
             return
-        
-        # Check if we've already processed this exact text
-        import hashlib
-        text_hash = hashlib.md5(text.encode()).hexdigest()
-        
-        if text_hash == st.session_state.last_processed_hash:
+
+        if _fingerprint(text) == st.session_state.last_processed_hash:
             st.info("This text has already been processed. Results shown below.")
             return
-        
-        with st.spinner("Processing text and extracting entities..."):
+
+        with st.status("Processing text and extracting entities...", expanded=True) as status:
             try:
-                # Create a progress bar for the different steps
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                
-                # Step 1: Extract entities (cached)
-                status_text.text("Extracting entities...")
-                progress_bar.progress(25)
-                entities = self.cached_extract_entities(text)
-                
-                # Step 2: Link to Wikidata (cached)
-                status_text.text("Linking to Wikidata...")
-                progress_bar.progress(50)
-                entities_json = json.dumps(entities, default=str)  # Handle non-serializable objects
-                linked_entities_json = self.cached_link_to_wikidata(entities_json)
-                entities = json.loads(linked_entities_json)
-                
-                # Step 3: Link to Wikipedia (cached)
-                status_text.text("Linking to Wikipedia...")
-                progress_bar.progress(60)
-                entities_json = json.dumps(entities, default=str)
-                linked_entities_json = self.cached_link_to_wikipedia(entities_json)
-                entities = json.loads(linked_entities_json)
-                
-                # Step 4: Link to Britannica (cached)
-                status_text.text("Linking to Britannica...")
-                progress_bar.progress(70)
-                entities_json = json.dumps(entities, default=str)
-                linked_entities_json = self.cached_link_to_britannica(entities_json)
-                entities = json.loads(linked_entities_json)
-                
-                # Step 5: Get coordinates
-                status_text.text("Getting coordinates...")
-                progress_bar.progress(85)
-                # Geocode all place entities more aggressively
-                place_entities = [e for e in entities if e['type'] in ['LOCATION', 'GPE', 'FACILITY', 'ORGANIZATION']]
-                
-                if place_entities:
-                    try:
-                        # Use the get_coordinates method which handles multiple geocoding services
-                        geocoded_entities = self.entity_linker.get_coordinates(place_entities)
-                        
-                        # Update the entities list with geocoded results
-                        for geocoded_entity in geocoded_entities:
-                            # Find the corresponding entity in the main list and update it
-                            for idx, entity in enumerate(entities):
-                                if (entity['text'] == geocoded_entity['text'] and 
-                                    entity['type'] == geocoded_entity['type'] and
-                                    entity['start'] == geocoded_entity['start']):
-                                    entities[idx] = geocoded_entity
-                                    break
-                    except Exception as e:
-                        st.warning(f"Some geocoding failed: {e}")
-                        # Continue with processing even if geocoding fails
-                
-                # Step 6: Link addresses to OpenStreetMap
-                status_text.text("Linking addresses to OpenStreetMap...")
-                progress_bar.progress(90)
-                entities = self.entity_linker.link_to_openstreetmap(entities)
-                
-                # Step 7: Generate visualization
-                status_text.text("Generating visualization...")
-                progress_bar.progress(100)
-                html_content = self.create_highlighted_html(text, entities)
-                
-                # Store in session state
-                st.session_state.entities = entities
+                result = _run_pipeline(text, title, _status=status)
+
+                # Store in session state; last_result is what
+                # render_results draws from on subsequent reruns
+                st.session_state.last_result = result
+                st.session_state.entities = result['entities']
                 st.session_state.processed_text = text
-                st.session_state.html_content = html_content
+                st.session_state.html_content = result['html_content']
                 st.session_state.analysis_title = title
-                st.session_state.last_processed_hash = text_hash
-                
-                # Clear progress indicators
-                progress_bar.empty()
-                status_text.empty()
-                
-                st.success(f"Processing complete! Found {len(entities)} entities.")
-                
+                st.session_state.last_processed_hash = result['text_hash']
+
+                status.update(
+                    label=f"Processing complete! Found {len(result['entities'])} entities.",
+                    state="complete", expanded=False
+                )
+
+                st.success(f"Processing complete! Found {len(result['entities'])} entities.")
+
             except Exception as e:
                 st.error(f"Error processing text: {e}")
                 st.exception(e)
@@ -1202,99 +1798,118 @@ class StreamlitEntityLinker:
             HTML string with highlighted entities
         """
         import html as html_module
-        
-        # Sort entities by start position (reverse for safe replacement)
-        sorted_entities = sorted(entities, key=lambda x: x['start'], reverse=True)
-        
-        # Start with escaped text
-        highlighted = html_module.escape(text)
-        
+
+        # Sort entities by start position for a single left-to-right walk
+        sorted_entities = sorted(entities, key=lambda x: x['start'])
+
         # Color scheme (updated for Flair entity types)
         colors = {
-            'PERSON': '#BF7B69',          # F&B Red earth        
+            'PERSON': '#BF7B69',          # F&B Red earth
             'ORGANIZATION': '#9fd2cd',    # F&B Blue ground
-            'LOCATION': '#EFCA89',        # F&B Yellow ground 
+            'LOCATION': '#EFCA89',        # F&B Yellow ground
             'MISC': '#C4C3A2',            # F&B Cooking apple green
             'GPE': '#C4C3A2',             # F&B Cooking apple green
             'FACILITY': '#C3B5AC',        # F&B Elephants breath
             'GSP': '#C4A998',             # F&B Dead salmon
             'ADDRESS': '#CCBEAA'          # F&B Oxford stone
         }
-        
-        # Replace entities from end to start
+
+        # Escape the whole document once with str.translate, and build a
+        # raw-index -> escaped-index map so entity offsets can be spliced
+        # into the escaped text without re-escaping any slice
+        from array import array
+
+        escaped = text.translate(self._ESCAPE_TABLE)
+        offset_map = array('i', bytes(4 * (len(text) + 1)))
+        position = 0
+        for i, ch in enumerate(text):
+            offset_map[i] = position
+            replacement_text = self._ESCAPE_TABLE.get(ord(ch))
+            position += len(replacement_text) if replacement_text else 1
+        offset_map[len(text)] = position
+
+        # Build the output as a list of parts (escaped gaps + entity spans)
+        # and join once at the end - O(length) instead of re-escaping the
+        # document prefix and slicing the whole string for every entity
+        parts = []
+        cursor = 0
+
         for entity in sorted_entities:
             # Highlight entities that have links OR coordinates
-            has_links = (entity.get('britannica_url') or 
-                         entity.get('wikidata_url') or 
-                         entity.get('wikipedia_url') or     
+            has_links = (entity.get('britannica_url') or
+                         entity.get('wikidata_url') or
+                         entity.get('wikipedia_url') or
                          entity.get('openstreetmap_url'))
             has_coordinates = entity.get('latitude') is not None
-            
+
             if not (has_links or has_coordinates):
                 continue
-                
+
             start = entity['start']
             end = entity['end']
-            original_entity_text = text[start:end]
-            escaped_entity_text = html_module.escape(original_entity_text)
+            if start < cursor:
+                continue  # Overlaps a span already emitted
+
+            escaped_entity_text = escaped[offset_map[start]:offset_map[end]]
             color = colors.get(entity['type'], '#E7E2D2')
-            
+
             # Create tooltip with entity information
             tooltip_parts = [f"Type: {entity['type']}"]
             if entity.get('wikidata_description'):
                 tooltip_parts.append(f"Description: {entity['wikidata_description']}")
             if entity.get('location_name'):
                 tooltip_parts.append(f"Location: {entity['location_name']}")
-            
+
             tooltip = " | ".join(tooltip_parts)
-            
+
             # Create highlighted span with link (priority: Wikipedia > Wikidata > Britannica > OpenStreetMap > Coordinates only)
-            if entity.get('wikipedia_url'):
-                url = html_module.escape(entity["wikipedia_url"])
-                replacement = f'<a href="{url}" style="background-color: {color}; padding: 2px 4px; border-radius: 3px; text-decoration: none; color: black;" target="_blank" title="{tooltip}">{escaped_entity_text}</a>'
-            elif entity.get('wikidata_url'):
-                url = html_module.escape(entity["wikidata_url"])
-                replacement = f'<a href="{url}" style="background-color: {color}; padding: 2px 4px; border-radius: 3px; text-decoration: none; color: black;" target="_blank" title="{tooltip}">{escaped_entity_text}</a>'
-            elif entity.get('britannica_url'):
-                url = html_module.escape(entity["britannica_url"])
-                replacement = f'<a href="{url}" style="background-color: {color}; padding: 2px 4px; border-radius: 3px; text-decoration: none; color: black;" target="_blank" title="{tooltip}">{escaped_entity_text}</a>'
-            elif entity.get('openstreetmap_url'):
-                url = html_module.escape(entity["openstreetmap_url"])
+            link_url = (entity.get('wikipedia_url') or
+                        entity.get('wikidata_url') or
+                        entity.get('britannica_url') or
+                        entity.get('openstreetmap_url'))
+            if link_url:
+                url = html_module.escape(link_url)
                 replacement = f'<a href="{url}" style="background-color: {color}; padding: 2px 4px; border-radius: 3px; text-decoration: none; color: black;" target="_blank" title="{tooltip}">{escaped_entity_text}</a>'
             else:
                 # Just highlight with coordinates (no link)
                 replacement = f'<span style="background-color: {color}; padding: 2px 4px; border-radius: 3px;" title="{tooltip}">{escaped_entity_text}</span>'
-            
-            # Calculate positions in escaped text
-            text_before_entity = html_module.escape(text[:start])
-            text_entity_escaped = html_module.escape(text[start:end])
-            
-            escaped_start = len(text_before_entity)
-            escaped_end = escaped_start + len(text_entity_escaped)
-            
-            # Replace in the escaped text
-            highlighted = highlighted[:escaped_start] + replacement + highlighted[escaped_end:]
-        
-        return highlighted
 
+            # Escaped gap since the previous entity, then the entity span
+            parts.append(escaped[offset_map[cursor]:offset_map[start]])
+            parts.append(replacement)
+            cursor = end
+
+        # Remainder of the document after the last highlighted entity
+        parts.append(escaped[offset_map[cursor]:])
+
+        return ''.join(parts)
+
+    @_fragment
     def render_results(self):
-        """Render the results section with entities and visualizations."""
-        if not st.session_state.entities:
+        """Render the results section with entities and visualizations.
+
+        Runs as a fragment where supported, so interactions elsewhere
+        on the page don't re-render the results DOM.
+        """
+        # Render from the last stored pipeline result, so reruns caused
+        # by unrelated widgets never recompute anything here
+        result = st.session_state.get('last_result')
+        if not result or not result['entities']:
             st.info("Enter some text above and click 'Process Text' to see results.")
             return
-        
-        entities = st.session_state.entities
-        
+
+        entities = result['entities']
+
         st.header("Results")
-        
+
         # Add statistics display
         self.render_statistics(entities)
-        
+
         # Highlighted text
         st.subheader("Highlighted Text")
-        if st.session_state.html_content:
+        if result['html_content']:
             st.markdown(
-                st.session_state.html_content,
+                result['html_content'],
                 unsafe_allow_html=True
             )
         else:
@@ -1302,7 +1917,7 @@ class StreamlitEntityLinker:
         
         # Entity details in collapsible section for mobile
         with st.expander("Entity Details", expanded=False):
-            self.render_entity_table(entities)
+            self.render_entity_table(entities, result.get('entity_table_html'))
         
         # Export options in collapsible section for mobile
         with st.expander("Export Results", expanded=False):
@@ -1310,51 +1925,89 @@ class StreamlitEntityLinker:
 
     def render_statistics(self, entities: List[Dict[str, Any]]):
         """Render statistics about the extracted entities."""
+        # Gather all the counts in a single pass over the entities
+        geocoded_count = 0
+        linked_count = 0
+        unique_types = set()
+        for entity in entities:
+            unique_types.add(entity['type'])
+            if entity.get('latitude'):
+                geocoded_count += 1
+            if entity.get('wikidata_url') or entity.get('wikipedia_url') or entity.get('britannica_url'):
+                linked_count += 1
+
         # Create columns for metrics (works well on mobile)
         col1, col2 = st.columns(2)
-        
+
         with col1:
             st.metric("Total Entities", len(entities))
-            geocoded_count = len([e for e in entities if e.get('latitude')])
             st.metric("Geocoded Places", geocoded_count)
-        
+
         with col2:
-            linked_count = len([e for e in entities if e.get('wikidata_url') or e.get('wikipedia_url') or e.get('britannica_url')])
             st.metric("Linked Entities", linked_count)
-            unique_types = len(set(e['type'] for e in entities))
-            st.metric("Entity Types", unique_types)
+            st.metric("Entity Types", len(unique_types))
+
+    def entity_table_html(self, entities: List[Dict[str, Any]]) -> str:
+        """Build the entity-details table as a static HTML string.
+
+        Called from the cached pipeline, so the pandas work and HTML
+        generation happen once per text instead of re-serializing a
+        DataFrame over the websocket on every rerun.
+        """
+        # Build typed columns in one pass instead of a list of row dicts;
+        # pandas would otherwise re-infer dtypes and copy the data again
+        entity_col = []
+        type_col = []
+        links_col = []
+        description_col = []
+        coordinates_col = []
+        location_col = []
+        for entity in entities:
+            entity_col.append(entity['text'])
+            type_col.append(entity['type'])
+            links_col.append(self.format_entity_links(entity))
+
+            description_col.append(
+                entity.get('wikidata_description')
+                or entity.get('wikipedia_description')
+                or entity.get('britannica_title')
+            )
+
+            if entity.get('latitude'):
+                coordinates_col.append(f"{entity['latitude']:.4f}, {entity['longitude']:.4f}")
+                location_col.append(entity.get('location_name', ''))
+            else:
+                coordinates_col.append(None)
+                location_col.append(None)
+
+        columns = {
+            'Entity': entity_col,
+            'Type': type_col,
+            'Links': links_col
+        }
+        # Only show the optional columns when at least one row has a value,
+        # matching what pd.DataFrame(list_of_dicts) produced before
+        if any(d is not None for d in description_col):
+            columns['Description'] = description_col
+        if any(c is not None for c in coordinates_col):
+            columns['Coordinates'] = coordinates_col
+            columns['Location'] = location_col
 
-    def render_entity_table(self, entities: List[Dict[str, Any]]):
+        df = pd.DataFrame(columns)
+        return df.to_html(classes='ner-table', index=False, na_rep='')
+
+    def render_entity_table(self, entities: List[Dict[str, Any]],
+                            table_html: str = None):
         """Render a table of entity details."""
         if not entities:
             st.info("No entities found.")
             return
-        
-        # Prepare data for table
-        table_data = []
-        for entity in entities:
-            row = {
-                'Entity': entity['text'],
-                'Type': entity['type'],
-                'Links': self.format_entity_links(entity)
-            }
-            
-            if entity.get('wikidata_description'):
-                row['Description'] = entity['wikidata_description']
-            elif entity.get('wikipedia_description'):
-                row['Description'] = entity['wikipedia_description']
-            elif entity.get('britannica_title'):
-                row['Description'] = entity['britannica_title']
-            
-            if entity.get('latitude'):
-                row['Coordinates'] = f"{entity['latitude']:.4f}, {entity['longitude']:.4f}"
-                row['Location'] = entity.get('location_name', '')
-            
-            table_data.append(row)
-        
-        # Create DataFrame and display
-        df = pd.DataFrame(table_data)
-        st.dataframe(df, use_container_width=True)
+
+        # Emit the precomputed HTML when the pipeline supplied it; the
+        # styles live in assets/theme.css
+        if table_html is None:
+            table_html = self.entity_table_html(entities)
+        st.markdown(table_html, unsafe_allow_html=True)
 
     def format_entity_links(self, entity: Dict[str, Any]) -> str:
         """Format entity links for display in table."""
@@ -1373,194 +2026,69 @@ class StreamlitEntityLinker:
         """Render export options for the results."""
         # Stack buttons vertically for mobile
         col1, col2 = st.columns(2)
-        
+
+        # The export documents only change when the processed text does, so
+        # build them through cached helpers instead of on every rerun
+        text_hash = st.session_state.get('last_processed_hash', '')
+        title = st.session_state.analysis_title
+
         with col1:
             # JSON export - create JSON-LD format
-            json_data = {
-                "@context": "http://schema.org/",
-                "@type": "TextDigitalDocument",
-                "text": st.session_state.processed_text,
-                "dateCreated": str(pd.Timestamp.now().isoformat()),
-                "title": st.session_state.analysis_title,
-                "entities": []
-            }
-            
-            # Format entities for JSON-LD
-            for entity in entities:
-                entity_data = {
-                    "name": entity['text'],
-                    "type": entity['type'],
-                    "startOffset": entity['start'],
-                    "endOffset": entity['end']
-                }
-                
-                if entity.get('wikidata_url'):
-                    entity_data['sameAs'] = entity['wikidata_url']
-                
-                if entity.get('wikidata_description'):
-                    entity_data['description'] = entity['wikidata_description']
-                elif entity.get('wikipedia_description'):
-                    entity_data['description'] = entity['wikipedia_description']
-                elif entity.get('britannica_title'):
-                    entity_data['description'] = entity['britannica_title']
-                
-                if entity.get('latitude') and entity.get('longitude'):
-                    entity_data['geo'] = {
-                        "@type": "GeoCoordinates",
-                        "latitude": entity['latitude'],
-                        "longitude": entity['longitude']
-                    }
-                    if entity.get('location_name'):
-                        entity_data['geo']['name'] = entity['location_name']
-                
-                if entity.get('wikipedia_url'):
-                    if 'sameAs' in entity_data:
-                        if isinstance(entity_data['sameAs'], str):
-                            entity_data['sameAs'] = [entity_data['sameAs'], entity['wikipedia_url']]
-                        else:
-                            entity_data['sameAs'].append(entity['wikipedia_url'])
-                    else:
-                        entity_data['sameAs'] = entity['wikipedia_url']
-                
-                if entity.get('britannica_url'):
-                    if 'sameAs' in entity_data:
-                        if isinstance(entity_data['sameAs'], str):
-                            entity_data['sameAs'] = [entity_data['sameAs'], entity['britannica_url']]
-                        else:
-                            entity_data['sameAs'].append(entity['britannica_url'])
-                    else:
-                        entity_data['sameAs'] = entity['britannica_url']
-                
-                if entity.get('openstreetmap_url'):
-                    if 'sameAs' in entity_data:
-                        if isinstance(entity_data['sameAs'], str):
-                            entity_data['sameAs'] = [entity_data['sameAs'], entity['openstreetmap_url']]
-                        else:
-                            entity_data['sameAs'].append(entity['openstreetmap_url'])
-                    else:
-                        entity_data['sameAs'] = entity['openstreetmap_url']
-                
-                json_data['entities'].append(entity_data)
-            
-            json_str = json.dumps(json_data, indent=2, ensure_ascii=False)
-            
+            json_str = _build_jsonld(
+                text_hash, title, st.session_state.processed_text, entities)
+
             st.download_button(
                 label="Download JSON-LD",
                 data=json_str,
-                file_name=f"{st.session_state.analysis_title}_entities.jsonld",
+                file_name=f"{title}_entities.jsonld",
                 mime="application/ld+json",
                 use_container_width=True
             )
-        
+
         with col2:
             # HTML export
             if st.session_state.html_content:
-                html_template = f"""
-                <!DOCTYPE html>
-                <html>
-                <head>
-                    <title>Entity Analysis: {st.session_state.analysis_title}</title>
-                    <meta charset="utf-8">
-                    <meta name="viewport" content="width=device-width, initial-scale=1">
-                    <style>
-                        body {{ font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px; }}
-                        .content {{ background: white; padding: 20px; border: 1px solid #ddd; border-radius: 5px; line-height: 1.6; }}
-                        .header {{ background: #f5f5f5; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
-                        @media (max-width: 768px) {{
-                            body {{ padding: 10px; }}
-                            .content {{ padding: 15px; }}
-                            .header {{ padding: 10px; }}
-                        }}
-                    </style>
-                </head>
-                <body>
-                    <div class="header">
-                        <h1>Entity Analysis: {st.session_state.analysis_title}</h1>
-                        <p>Generated on {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-                        <p>Found {len(entities)} entities</p>
-                    </div>
-                    <div class="content">
-                        {st.session_state.html_content}
-                    </div>
-                </body>
-                </html>
-                """
-                
+                html_template = _build_export_html(
+                    text_hash, title, len(entities), st.session_state.html_content)
+
                 st.download_button(
                     label="Download HTML",
                     data=html_template,
-                    file_name=f"{st.session_state.analysis_title}_entities.html",
+                    file_name=f"{title}_entities.html",
                     mime="text/html",
                     use_container_width=True
                 )
 
     def run(self):
         """Main application runner."""
-        # Add custom CSS for Farrow & Ball Slipper Satin background
-        st.markdown("""
-        <style>
-        .stApp {
-            background-color: #F5F0DC !important;
-        }
-        .main .block-container {
-            background-color: #F5F0DC !important;
-        }
-        .stSidebar {
-            background-color: #F5F0DC !important;
-        }
-        .stSelectbox > div > div {
-            background-color: white !important;
-        }
-        .stTextInput > div > div > input {
-            background-color: white !important;
-        }
-        .stTextArea > div > div > textarea {
-            background-color: white !important;
-        }
-        .stExpander {
-            background-color: white !important;
-            border: 1px solid #E0D7C0 !important;
-            border-radius: 4px !important;
-        }
-        .stDataFrame {
-            background-color: white !important;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-        
+        self._init_session_state()
+
+        # Emit the custom CSS every run - Streamlit drops elements that
+        # aren't re-emitted during a rerun, so a one-time injection would
+        # lose the theme on the first interaction. Still cheaper than
+        # before: one merged block, read once at import.
+        if _CSS:
+            st.markdown(_CSS, unsafe_allow_html=True)
+
         # Render header
         self.render_header()
-        
+
         # Render sidebar
         self.render_sidebar()
-        
+
         # Single column layout for mobile compatibility
-        # Input section
-        text_input, analysis_title = self.render_input_section()
-        
-        # Process button with custom Farrow & Ball Dead Salmon color
-        st.markdown("""
-        <style>
-        .stButton > button {
-            background-color: #C4A998 !important;
-            color: black !important;
-            border: none !important;
-            border-radius: 4px !important;
-            font-weight: 500 !important;
-        }
-        .stButton > button:hover {
-            background-color: #B5998A !important;
-            color: black !important;
-        }
-        .stButton > button:active {
-            background-color: #A68977 !important;
-            color: black !important;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-        
-        if st.button("Process Text", type="primary", use_container_width=True):
-            if text_input.strip():
+        # Input section and submit button live in a form so typing in
+        # the text area doesn't trigger a rerun per keystroke - the
+        # script only reruns once, on submit
+        with st.form("ner_form", clear_on_submit=False):
+            text_input, analysis_title = self.render_input_section()
+            submitted = st.form_submit_button(
+                "Process Text", type="primary", use_container_width=True)
+
+        if submitted:
+            # isspace() avoids allocating a stripped copy of what may be
+            # a multi-megabyte paste just to test for emptiness
+            if text_input and not text_input.isspace():
                 self.process_text(text_input, analysis_title)
             else:
                 st.warning("Please enter some text to analyze.")
@@ -1572,10 +2100,138 @@ class StreamlitEntityLinker:
         self.render_results()
 
 
+def _fingerprint(text: str) -> str:
+    """Fingerprint a text for cache keys.
+
+    xxhash handles large pastes far faster than a cryptographic hash,
+    with BLAKE2b as the stdlib fallback.
+    """
+    try:
+        import xxhash
+        return xxhash.xxh3_64_hexdigest(text)
+    except ImportError:
+        import hashlib
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _run_pipeline(text: str, title: str, _status=None) -> Dict[str, Any]:
+    """
+    Run the full NER and linking pipeline for a text.
+
+    Cached on (text, title) so resubmitting the same text - or several
+    sessions pasting the same text - pays for one Flair pass, not N.
+    Returns a plain dict so the cache stores cheap, copyable data. The
+    optional status container reports progress on cache misses only.
+    """
+    def note(label):
+        if _status is not None:
+            _status.update(label=label)
+
+    app = _get_app()
+    text_hash = _fingerprint(text)
+
+    # Step 1: Extract entities (cached)
+    note("Extracting entities...")
+    entities = app.cached_extract_entities(text)
+
+    # Steps 2-3: Link to Wikidata and Wikipedia concurrently - the
+    # lookups are independent per entity and I/O bound, so total time
+    # is the slower of the two, not their sum.
+    note("Linking to Wikidata and Wikipedia...")
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = {
+            executor.submit(app.cached_link_to_wikidata, entities, text_hash): 'Wikidata',
+            executor.submit(app.cached_link_to_wikipedia, entities, text_hash): 'Wikipedia',
+        }
+        linked_results = {}
+        for future in as_completed(futures):
+            linked_results[futures[future]] = future.result()
+
+    wikidata_entities = linked_results['Wikidata']
+    wikipedia_entities = linked_results['Wikipedia']
+
+    # Merge the enrichment fields back by entity index. Parity with the
+    # serial order this replaced: Wikipedia was only consulted when
+    # Wikidata found nothing, so its fields are dropped for entities the
+    # Wikidata pass resolved - concurrency changes timing, not output.
+    for idx, entity in enumerate(entities):
+        for field, value in wikidata_entities[idx].items():
+            if field not in entity:
+                entity[field] = value
+        if not entity.get('wikidata_url'):
+            for field, value in wikipedia_entities[idx].items():
+                if field not in entity:
+                    entity[field] = value
+
+    # Step 4: Britannica is only ever used as a fallback when no wiki
+    # link exists, so only the still-unlinked entities are sent to it -
+    # typically a small minority. Filtering before the cached call also
+    # keeps its cache entries small.
+    unlinked_idx = [i for i, e in enumerate(entities)
+                    if not (e.get('wikidata_url') or e.get('wikipedia_url'))]
+    if unlinked_idx:
+        note("Linking to Britannica...")
+        britannica_entities = app.cached_link_to_britannica(
+            [entities[i] for i in unlinked_idx], text_hash)
+        for i, linked in zip(unlinked_idx, britannica_entities):
+            for field, value in linked.items():
+                if field not in entities[i]:
+                    entities[i][field] = value
+
+    # Step 5: Get coordinates
+    note("Getting coordinates...")
+    # Geocode all place entities more aggressively
+    place_entities = [e for e in entities if e['type'] in _PLACE_TYPES]
+
+    if place_entities:
+        try:
+            # Use the get_coordinates method which handles multiple geocoding
+            # services; pass this run's text so the cached result doesn't
+            # depend on leftover session state
+            geocoded_entities = app.entity_linker.get_coordinates(place_entities, text)
+
+            # Update the entities list with geocoded results via a
+            # single index map instead of a nested scan
+            idx_map = {(e['text'], e['type'], e['start']): i
+                       for i, e in enumerate(entities)}
+            for geocoded_entity in geocoded_entities:
+                idx = idx_map.get((geocoded_entity['text'],
+                                   geocoded_entity['type'],
+                                   geocoded_entity['start']))
+                if idx is not None:
+                    entities[idx] = geocoded_entity
+        except Exception:
+            # Continue with processing even if geocoding fails
+            pass
+
+    # Step 6: Link addresses to OpenStreetMap
+    note("Linking addresses to OpenStreetMap...")
+    entities = app.entity_linker.link_to_openstreetmap(entities)
+
+    # Step 7: Generate visualization
+    note("Generating visualization...")
+    html_content = app.create_highlighted_html(text, entities)
+
+    return {
+        'entities': entities,
+        'html_content': html_content,
+        'entity_table_html': app.entity_table_html(entities),
+        'text_hash': text_hash,
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def _get_app() -> 'StreamlitEntityLinker':
+    """Build the app object once and share it across reruns and sessions."""
+    return StreamlitEntityLinker()
+
+
 def main():
     """Main function to run the Streamlit application."""
-    app = StreamlitEntityLinker()
-    app.run()
+    _get_app().run()
 
 
 if __name__ == "__main__":